@@ -11,12 +11,18 @@ from typing import Any, Dict, Optional
 from fastapi import HTTPException, status
 from openai import OpenAI
 
-from ...models.conversation import ConversationChatRequest, ConversationChatResponse
+from ...models.conversation import (
+    ConversationChatBatchRequest,
+    ConversationChatBatchResponse,
+    ConversationChatRequest,
+    ConversationChatResponse,
+)
 
 # Import the shared SSE service from the sse module
 from ..sse import get_local_sse_service
 from . import router
 from .dependencies import conversation_manager, provider_manager, server_manager
+from .tools_endpoints import enable_tool
 
 
 def inject_required_context_arguments(input_schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -506,3 +512,41 @@ async def conversation_chat(conversation_id: str, request: ConversationChatReque
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get LLM response: {str(e)}",
         )
+
+
+@router.post(
+    "/{conversation_id}/chat/batch", response_model=ConversationChatBatchResponse
+)
+async def conversation_chat_batch(
+    conversation_id: str, request: ConversationChatBatchRequest
+) -> ConversationChatBatchResponse:
+    """
+    Enable tools, send a message and get the conversation in one request.
+
+    Runs the same steps as POST /tools for each tool, then POST /chat and
+    GET /messages, saving two round-trips for clients that always do them
+    together. The steps are not transactional: tools enabled before the chat
+    step stay enabled if sending the message fails.
+
+    - **conversation_id**: Conversation identifier
+    - **enable_tools**: Tools to enable before sending the message
+    - **content**: User message content
+    - **return_all_messages**: Whether to include all conversation messages
+    """
+    for tool_request in request.enable_tools:
+        await enable_tool(conversation_id, tool_request)
+
+    chat = await conversation_chat(
+        conversation_id, ConversationChatRequest(content=request.content)
+    )
+
+    messages = None
+    if request.return_all_messages:
+        messages = conversation_manager.get_messages(conversation_id)
+
+    return ConversationChatBatchResponse(
+        success=True,
+        enabled_tools=conversation_manager.get_tools(conversation_id) or [],
+        chat=chat,
+        messages=messages,
+    )
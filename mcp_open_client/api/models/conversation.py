@@ -94,6 +94,10 @@ class Conversation(BaseModel):
     messages: List[Message] = Field(
         default_factory=list, description="Conversation messages"
     )
+    has_tool_calls: bool = Field(
+        default=True,
+        description="Whether any tool call or tool response has been recorded",
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -303,3 +307,32 @@ class ConversationChatResponse(BaseModel):
     )
 
     model_config = ConfigDict(extra="forbid")
+
+
+class ConversationChatBatchRequest(BaseModel):
+    """Request to enable tools, send a message and fetch the conversation at once."""
+
+    enable_tools: List[EnabledToolCreateRequest] = Field(
+        default_factory=list, description="Tools to enable before sending the message"
+    )
+    content: str = Field(..., description="User message content")
+    return_all_messages: bool = Field(
+        True, description="Whether to include all conversation messages"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ConversationChatBatchResponse(BaseModel):
+    """Response from the composite chat endpoint."""
+
+    success: bool = Field(..., description="Whether the operation was successful")
+    enabled_tools: List[EnabledTool] = Field(
+        ..., description="Enabled tools after applying the request"
+    )
+    chat: ConversationChatResponse = Field(..., description="Chat result")
+    messages: Optional[List[Message]] = Field(
+        None, description="All conversation messages, if requested"
+    )
+
+    model_config = ConfigDict(extra="forbid")
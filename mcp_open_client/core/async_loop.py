@@ -0,0 +1,131 @@
+"""
+Async Loop Thread - Run MCP operations on a dedicated event loop thread.
+
+FastMCP clients are bound to the event loop they were connected on. This
+module keeps one loop running in a background thread so synchronous callers
+can share the same connected clients instead of each spinning up their own
+loop.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Dict, List, Optional, TypeVar
+
+from ..api.models.server import ServerInfo, ToolInfo
+from .manager import MCPServerManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncLoopThread(threading.Thread):
+    """Daemon thread that owns and runs an asyncio event loop."""
+
+    def __init__(self) -> None:
+        """Create the event loop; call start() to begin running it."""
+        super().__init__(name="mcp-async-loop", daemon=True)
+        self.loop = asyncio.new_event_loop()
+
+    def run(self) -> None:
+        """Run the event loop until stop() is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """
+        Schedule a coroutine on the loop thread.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Future resolving to the coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self) -> None:
+        """Stop the event loop and wait for the thread to exit."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+        self.loop.close()
+
+
+class MCPClientWrapper:
+    """
+    Synchronous facade over MCPServerManager.
+
+    All manager calls run on a single AsyncLoopThread, so calls made from
+    several threads are dispatched concurrently against the same persistent
+    FastMCP clients.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[MCPServerManager] = None,
+        timeout: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initialize the wrapper and start its loop thread.
+
+        Args:
+            manager: Manager to wrap (a new one is created if not provided)
+            timeout: Seconds to wait for each call (None waits forever)
+        """
+        self._manager = manager or MCPServerManager()
+        self._timeout = timeout
+        self._loop_thread = AsyncLoopThread()
+        self._loop_thread.start()
+
+    @property
+    def manager(self) -> MCPServerManager:
+        """The wrapped MCPServerManager."""
+        return self._manager
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the loop thread and wait for its result.
+
+        If the wait times out the coroutine is cancelled as well, so an
+        operation the caller gave up on does not still complete later.
+        """
+        future = self._loop_thread.submit(coro)
+        try:
+            return future.result(self._timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def start_server_sync(self, server_id: str) -> ServerInfo:
+        """Start a server. See MCPServerManager.start_server."""
+        return self._run(self._manager.start_server(server_id))
+
+    def stop_server_sync(self, server_id: str) -> ServerInfo:
+        """Stop a server. See MCPServerManager.stop_server."""
+        return self._run(self._manager.stop_server(server_id))
+
+    def list_tools_sync(self, server_id: str) -> List[ToolInfo]:
+        """List tools of a running server. See MCPServerManager.get_server_tools."""
+        return self._run(self._manager.get_server_tools(server_id))
+
+    def call_tool_sync(
+        self,
+        server_id: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Call a tool on a running server. See MCPServerManager.call_server_tool."""
+        return self._run(
+            self._manager.call_server_tool(server_id, tool_name, arguments)
+        )
+
+    def close(self) -> None:
+        """Shut down all servers and stop the loop thread."""
+        try:
+            self._run(self._manager.shutdown_all())
+        except Exception as e:
+            logger.error("Error shutting down servers: %s", e)
+        finally:
+            self._loop_thread.stop()
@@ -101,6 +101,7 @@ class ChatOperations:
                 max_tokens=conversation.max_tokens,
                 max_messages=conversation.max_messages,
                 model=model,
+                has_tool_calls=conversation.has_tool_calls,
             )
         else:
             # Just count tokens without applying window
@@ -42,6 +42,7 @@ class ConversationOperations:
             open_editors=[],
             context={},
             messages=[],
+            has_tool_calls=False,
         )
 
         self.storage.save(conversation)
@@ -49,6 +49,8 @@ class MessageOperations:
         )
 
         conversation.messages.append(message)
+        if tool_calls or role == "tool":
+            conversation.has_tool_calls = True
         conversation.updated_at = datetime.utcnow().isoformat() + "Z"
         self.storage.save(conversation)
         return message
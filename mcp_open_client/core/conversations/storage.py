@@ -2,7 +2,6 @@
 Conversation storage operations - handles file I/O.
 """
 
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -30,9 +29,7 @@ class ConversationStorage:
             return None
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return Conversation(**data)
+            return Conversation.model_validate_json(path.read_bytes())
         except Exception as e:
             raise Exception(f"Failed to load conversation {conversation_id}: {e}")
 
@@ -40,8 +37,7 @@ class ConversationStorage:
         """Save a conversation to disk."""
         path = self._get_conversation_path(conversation.id)
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(conversation.model_dump(), f, indent=2, ensure_ascii=False)
+            path.write_bytes(conversation.model_dump_json(indent=2).encode("utf-8"))
         except Exception as e:
             raise Exception(f"Failed to save conversation {conversation.id}: {e}")
 
@@ -62,9 +58,9 @@ class ConversationStorage:
         conversations = []
         for file_path in self.conversations_dir.glob("*.json"):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    conversations.append(Conversation(**data))
+                conversations.append(
+                    Conversation.model_validate_json(file_path.read_bytes())
+                )
             except Exception:
                 # Skip invalid files
                 continue
@@ -1,10 +1,13 @@
 """Token counting utilities for conversations."""
 
 import json
+import logging
 from typing import Any, Dict, List, Optional
 
 import tiktoken
 
+logger = logging.getLogger(__name__)
+
 
 class TokenCounter:
     """Handles token counting for messages."""
@@ -58,11 +61,15 @@ class TokenCounter:
         max_tokens: Optional[int] = None,
         max_messages: Optional[int] = None,
         model: str = "gpt-4o",
+        has_tool_calls: bool = True,
     ) -> tuple[List[Dict[str, Any]], int]:
         """
         Apply rolling window to messages based on token count or message count.
         Ensures tool call/response pairs are kept together.
 
+        When has_tool_calls is False the messages contain no tool calls or tool
+        responses, so the tool integrity passes are skipped.
+
         Returns:
             tuple: (filtered_messages, total_token_count)
         """
@@ -70,19 +77,25 @@ class TokenCounter:
             return messages, 0
 
         # First, verify tool integrity and clean orphaned tool responses
-        messages = self._verify_tool_integrity(messages)
+        if has_tool_calls:
+            messages = self._verify_tool_integrity(messages)
 
         # Apply max_messages limit first (simpler)
         if max_messages is not None and len(messages) > max_messages:
-            messages = self._safe_apply_max_messages(messages, max_messages)
+            messages = self._safe_apply_max_messages(
+                messages, max_messages, has_tool_calls
+            )
 
         # Apply max_tokens limit (more complex)
         if max_tokens is not None:
-            messages = self._safe_apply_max_tokens(messages, max_tokens, model)
+            messages = self._safe_apply_max_tokens(
+                messages, max_tokens, model, has_tool_calls
+            )
 
         # Final verification to ensure tool integrity
         # This is a safety check in case any edge cases were missed
-        messages = self._verify_tool_integrity(messages)
+        if has_tool_calls:
+            messages = self._verify_tool_integrity(messages)
 
         # Count final token total
         total_tokens = self.count_message_tokens(messages, model)
@@ -114,8 +127,10 @@ class TokenCounter:
                     verified.append(message)
                 else:
                     # Orphaned tool response, skip it
-                    print(
-                        f"[DEBUG] Removed orphaned tool response: {message.get('name', 'unknown')} (tool_call_id: {tool_call_id})"
+                    logger.debug(
+                        "Removed orphaned tool response: %s (tool_call_id: %s)",
+                        message.get("name", "unknown"),
+                        tool_call_id,
                     )
             else:
                 # Not a tool response, keep it
@@ -124,7 +139,10 @@ class TokenCounter:
         return verified
 
     def _safe_apply_max_messages(
-        self, messages: List[Dict[str, Any]], max_messages: int
+        self,
+        messages: List[Dict[str, Any]],
+        max_messages: int,
+        has_tool_calls: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Apply max_messages limit while maintaining tool call/response pairs.
@@ -136,10 +154,16 @@ class TokenCounter:
         trimmed = messages[-max_messages:]
 
         # Now ensure tool pairs are intact in the trimmed list
+        if not has_tool_calls:
+            return trimmed
         return self._verify_tool_integrity(trimmed)
 
     def _safe_apply_max_tokens(
-        self, messages: List[Dict[str, Any]], max_tokens: int, model: str
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        model: str,
+        has_tool_calls: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Apply max_tokens limit while maintaining tool call/response pairs.
@@ -174,4 +198,6 @@ class TokenCounter:
 
         # Verify tool integrity before returning
         # This ensures no orphaned tool_calls or tool responses remain
+        if not has_tool_calls:
+            return filtered
         return self._verify_tool_integrity(filtered)
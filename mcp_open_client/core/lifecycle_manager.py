@@ -2,9 +2,11 @@
 Lifecycle Manager - Handle server lifecycle (start, stop, shutdown).
 """
 
+import asyncio
 import logging
 import traceback
-from typing import Any, Dict
+from contextlib import AsyncExitStack
+from typing import Any, Dict, Optional
 
 try:
     from fastmcp import Client
@@ -14,26 +16,222 @@ except ImportError:
 from ..api.models.server import ServerInfo, ServerStatus
 from ..exceptions import MCPError
 from .process import ProcessManager
-from .transport_factory import create_transport
+from .transport_factory import TransportPlan, create_transport, plan_transport
 
 logger = logging.getLogger(__name__)
 
 
+async def _connect(
+    server: ServerInfo,
+    transport: Any,
+    transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+    process_manager: ProcessManager,
+) -> Optional[Any]:
+    """
+    Open the persistent FastMCP client for a server.
+
+    This spawns the server subprocess and runs the MCP handshake once. The
+    client stays connected until _close_connection closes it, so tool calls
+    reuse the same session. It is not entered on the server's exit stack,
+    which lets a lost client be replaced without the stack growing.
+
+    If the connection fails, the server is marked as errored and its
+    transport is closed and unregistered, so it can be started again.
+
+    Returns:
+        Connected FastMCP client, or None if the connection failed
+    """
+    try:
+        client = Client(transport)
+        await client.__aenter__()
+        logger.info("Client connected for server: %s", server.config.name)
+        return client
+    except Exception as e:
+        logger.error("Failed to connect to server '%s': %s", server.config.name, e)
+        process_manager._update_server_status(
+            server.id, ServerStatus.ERROR, error_message=str(e)
+        )
+
+        # Unless the server was stopped or restarted meanwhile, this task is
+        # still its connection and the failed resources are ours to release
+        if connections.get(server.id) is asyncio.current_task():
+            transports.pop(server.id, None)
+            connections.pop(server.id, None)
+            exit_stack = exit_stacks.pop(server.id, None)
+            if exit_stack:
+                await exit_stack.aclose()
+        return None
+
+
+def _connected_client(task: Optional[asyncio.Task]) -> Optional[Any]:
+    """Return the client a finished connection task produced, if any."""
+    if task is None or not task.done() or task.cancelled() or task.exception():
+        return None
+    return task.result()
+
+
+async def _close_connection(task: Optional[asyncio.Task]) -> None:
+    """Cancel a connection task if still pending, or close its client."""
+    if task and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return
+
+    client = _connected_client(task)
+    if client is not None:
+        await client.close()
+
+
+async def _close_server(
+    server_id: str,
+    transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+) -> None:
+    """
+    Close the server's client and unwind its exit stack.
+
+    Closing the client disconnects the session, and the exit stack then
+    closes the transport, which stops the subprocess.
+    """
+    transports.pop(server_id, None)
+    await _close_resources(
+        connections.pop(server_id, None), exit_stacks.pop(server_id, None)
+    )
+
+
+async def _close_resources(
+    task: Optional[asyncio.Task], exit_stack: Optional[AsyncExitStack]
+) -> None:
+    """Close a connection task's client, then unwind the server's exit stack."""
+    try:
+        await _close_connection(task)
+    finally:
+        if exit_stack:
+            await exit_stack.aclose()
+
+
+async def _replace_client(
+    server: ServerInfo,
+    client: Any,
+    transport: Any,
+    transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+    process_manager: ProcessManager,
+) -> Optional[Any]:
+    """Close a client whose connection was lost and connect a new one."""
+    try:
+        await client.close()
+    except Exception as e:
+        logger.debug(
+            "Error closing lost client for server '%s': %s", server.config.name, e
+        )
+    return await _connect(
+        server, transport, transports, connections, exit_stacks, process_manager
+    )
+
+
+async def get_client(
+    server: ServerInfo,
+    connections: Dict[str, asyncio.Task],
+) -> Optional[Any]:
+    """
+    Get the persistent FastMCP client for a server.
+
+    Waits for the background connection if it is still in progress.
+
+    Args:
+        server: ServerInfo object
+        connections: Dictionary storing connection tasks by server ID
+
+    Returns:
+        Connected FastMCP client, or None if not available
+    """
+    task = connections.get(server.id)
+    if task is None:
+        return None
+
+    # Shield so a cancelled caller does not abort the shared connection
+    return await asyncio.shield(task)
+
+
+async def reconnect(
+    server: ServerInfo,
+    client: Optional[Any],
+    transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+    process_manager: ProcessManager,
+) -> Optional[Any]:
+    """
+    Replace a server's client after its connection was lost.
+
+    The lost client is closed, which also disconnects the transport from the
+    dead subprocess, and a new client is connected on the same transport,
+    which spawns a fresh one. Callers that lost the same client share a
+    single reconnect.
+
+    Args:
+        server: ServerInfo object
+        client: Client whose call failed with a lost connection
+        transports: Dictionary storing transport instances by server ID
+        connections: Dictionary storing connection tasks by server ID
+        exit_stacks: Dictionary storing per-server exit stacks by server ID
+        process_manager: ProcessManager instance
+
+    Returns:
+        Newly connected FastMCP client, or None if not available
+    """
+    task = connections.get(server.id)
+    transport = transports.get(server.id)
+    if task is None or transport is None:
+        return None
+
+    # Only the first caller to report this client replaces it; later ones
+    # find a different task and wait for that instead
+    if client is not None and _connected_client(task) is client:
+        logger.warning(
+            "Connection to server '%s' lost, reconnecting", server.config.name
+        )
+        connections[server.id] = asyncio.create_task(
+            _replace_client(
+                server,
+                client,
+                transport,
+                transports,
+                connections,
+                exit_stacks,
+                process_manager,
+            )
+        )
+    return await asyncio.shield(connections[server.id])
+
+
 async def start_server(
     server: ServerInfo,
     transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+    transport_plans: Dict[str, TransportPlan],
     process_manager: ProcessManager,
 ) -> ServerInfo:
     """
     Start an MCP server by creating a FastMCP transport.
 
     The transport has keep_alive=True, which means it will start and maintain
-    the subprocess connection. The transport can be reused across multiple
-    Client instances.
+    the subprocess connection. A persistent client is connected in a
+    background task, so the first tool call does not pay the cold start and
+    later calls reuse the same MCP session.
 
     Args:
         server: ServerInfo object
         transports: Dictionary storing transport instances by server ID
+        connections: Dictionary storing connection tasks by server ID
+        exit_stacks: Dictionary storing per-server exit stacks by server ID
+        transport_plans: Dictionary caching transport plans by server ID
         process_manager: ProcessManager instance
 
     Returns:
@@ -48,7 +246,8 @@ async def start_server(
     # Check if transport already exists (server was already running)
     if server.id in transports:
         logger.info(
-            f"Transport already exists for server: {server.config.name}, server is running"
+            "Transport already exists for server: %s, server is running",
+            server.config.name,
         )
         return server
 
@@ -56,28 +255,49 @@ async def start_server(
     server = process_manager._update_server_status(server.id, ServerStatus.STARTING)
 
     try:
-        logger.info(f"Creating FastMCP transport for server: {server.config.name}")
-        logger.info(f"Config command: {server.config.command}")
-        logger.info(f"Config args: {server.config.args}")
-
-        # Create FastMCP transport (with keep_alive=True)
-        transport = create_transport(server.config)
-
-        logger.info(f"Transport created successfully for server: {server.config.name}")
+        logger.info("Creating FastMCP transport for server: %s", server.config.name)
+        logger.debug("Config command: %s", server.config.command)
+        logger.debug("Config args: %s", server.config.args)
+
+        # Create FastMCP transport (with keep_alive=True), reusing the
+        # transport selection from previous starts of this server
+        plan = transport_plans.get(server.id)
+        if plan is None:
+            plan = transport_plans[server.id] = plan_transport(server.config)
+        transport = create_transport(server.config, plan)
+
+        logger.debug(
+            "Transport created successfully for server: %s", server.config.name
+        )
 
-        # Store the transport
+        # Store the transport and connect the client in the background
+        exit_stack = AsyncExitStack()
+        exit_stack.push_async_callback(transport.close)
         transports[server.id] = transport
+        exit_stacks[server.id] = exit_stack
+        connections[server.id] = asyncio.create_task(
+            _connect(
+                server,
+                transport,
+                transports,
+                connections,
+                exit_stacks,
+                process_manager,
+            )
+        )
 
         # Update server status to running
         server = process_manager._update_server_status(server.id, ServerStatus.RUNNING)
 
-        logger.info(f"Server '{server.config.name}' started successfully")
+        logger.info("Server '%s' started successfully", server.config.name)
         return server
 
     except Exception as e:
         # Log full traceback for debugging
         error_details = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
-        logger.error(f"Failed to start server '{server.config.name}': {error_details}")
+        logger.error(
+            "Failed to start server '%s': %s", server.config.name, error_details
+        )
 
         # Update status to error
         process_manager._update_server_status(
@@ -85,14 +305,10 @@ async def start_server(
         )
 
         # Clean up transport if it was stored
-        if server.id in transports:
-            try:
-                transport_instance = transports[server.id]
-                await transport_instance.close()
-            except Exception:
-                pass
-            finally:
-                del transports[server.id]
+        try:
+            await _close_server(server.id, transports, connections, exit_stacks)
+        except Exception:
+            pass
 
         # Re-raise with full error details
         raise MCPError(
@@ -103,6 +319,8 @@ async def start_server(
 async def stop_server(
     server: ServerInfo,
     transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
     process_manager: ProcessManager,
 ) -> ServerInfo:
     """
@@ -111,6 +329,8 @@ async def stop_server(
     Args:
         server: ServerInfo object
         transports: Dictionary storing transport instances by server ID
+        connections: Dictionary storing connection tasks by server ID
+        exit_stacks: Dictionary storing per-server exit stacks by server ID
         process_manager: ProcessManager instance
 
     Returns:
@@ -119,18 +339,14 @@ async def stop_server(
     # Update status to stopping
     server = process_manager._update_server_status(server.id, ServerStatus.STOPPING)
 
-    # Close transport if it exists
-    transport = transports.get(server.id)
-    if transport:
+    # Disconnect the client and close the transport (this stops the subprocess)
+    if server.id in exit_stacks:
         try:
-            logger.info(f"Closing transport for server: {server.config.name}")
-            # Close transport (this stops the subprocess)
-            await transport.close()
-            logger.info(f"Transport closed for server: {server.config.name}")
+            logger.info("Closing transport for server: %s", server.config.name)
+            await _close_server(server.id, transports, connections, exit_stacks)
+            logger.info("Transport closed for server: %s", server.config.name)
         except Exception as e:
-            logger.error(f"Error closing transport: {e}")
-        finally:
-            del transports[server.id]
+            logger.error("Error closing transport: %s", e)
 
     # Update status to stopped
     server = process_manager._update_server_status(server.id, ServerStatus.STOPPED)
@@ -141,6 +357,9 @@ async def stop_server(
 async def remove_server(
     server: ServerInfo,
     transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
+    transport_plans: Dict[str, TransportPlan],
     process_manager: ProcessManager,
 ) -> bool:
     """
@@ -149,49 +368,70 @@ async def remove_server(
     Args:
         server: ServerInfo object
         transports: Dictionary storing transport instances by server ID
+        connections: Dictionary storing connection tasks by server ID
+        exit_stacks: Dictionary storing per-server exit stacks by server ID
+        transport_plans: Dictionary caching transport plans by server ID
         process_manager: ProcessManager instance
 
     Returns:
         True if server was removed
     """
-    # Clean up FastMCP transport if exists
-    transport = transports.get(server.id)
-    if transport:
-        try:
-            await transport.close()
-        except Exception:
-            pass  # Ignore cleanup errors
-        finally:
-            del transports[server.id]
+    transport_plans.pop(server.id, None)
+
+    # Clean up FastMCP client and transport if they exist
+    try:
+        await _close_server(server.id, transports, connections, exit_stacks)
+    except Exception:
+        pass  # Ignore cleanup errors
 
     return await process_manager.remove_server(server.id)
 
 
 async def shutdown_all(
     transports: Dict[str, Any],
+    connections: Dict[str, asyncio.Task],
+    exit_stacks: Dict[str, AsyncExitStack],
     process_manager: ProcessManager,
+    max_concurrency: int = 32,
 ) -> None:
     """
     Shutdown all running servers and clean up transports.
 
     Args:
         transports: Dictionary storing transport instances by server ID
+        connections: Dictionary storing connection tasks by server ID
+        exit_stacks: Dictionary storing per-server exit stacks by server ID
         process_manager: ProcessManager instance
+        max_concurrency: Maximum number of servers being closed at once
     """
-    # Close all FastMCP transports
-    for server_id in list(transports.keys()):
-        transport = transports.get(server_id)
-        if transport:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _close(
+        server_id: str, task: Optional[asyncio.Task], exit_stack: AsyncExitStack
+    ) -> None:
+        async with semaphore:
             try:
-                logger.info(f"Closing transport for server {server_id}")
-                await transport.close()
+                logger.info("Closing transport for server %s", server_id)
+                await _close_resources(task, exit_stack)
             except Exception as e:
-                logger.error(f"Error closing transport for server {server_id}: {e}")
-                pass  # Ignore cleanup errors
-
+                logger.error("Error closing transport for server %s: %s", server_id, e)
+
+    # Take everything out of the shared dicts before awaiting, so servers
+    # started or stopped meanwhile cannot change what is being closed
+    items = tuple(
+        (server_id, connections.pop(server_id, None), exit_stack)
+        for server_id, exit_stack in exit_stacks.items()
+    )
+    exit_stacks.clear()
+    connections.clear()
     transports.clear()
 
-    # Update all server statuses to stopped
-    for server in process_manager.get_all_servers():
-        if server.status == ServerStatus.RUNNING:
-            process_manager._update_server_status(server.id, ServerStatus.STOPPED)
+    # Close all FastMCP clients and transports concurrently, a bounded
+    # number at a time
+    await asyncio.gather(*[_close(*item) for item in items])
+
+    # Update all running server statuses to stopped
+    process_manager._bulk_update_server_status(
+        process_manager.get_server_ids_by_status(ServerStatus.RUNNING),
+        ServerStatus.STOPPED,
+    )
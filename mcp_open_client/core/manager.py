@@ -8,12 +8,17 @@ This manager coordinates between different specialized modules:
 - process: Manages server configuration and state
 """
 
-from typing import Any, Dict, List, Optional
-
-from ..api.models.server import ServerInfo, ToolInfo
-from ..exceptions import MCPError
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..api.models.server import ServerConfig, ServerInfo, ServerStatus, ToolInfo
+from ..exceptions import ConnectionError, MCPError
 from . import lifecycle_manager, tool_operations
 from .process import ProcessManager
+from .transport_factory import TransportPlan
 
 
 class MCPServerManager:
@@ -29,6 +34,16 @@ class MCPServerManager:
         """Initialize MCP server manager."""
         self._process_manager = ProcessManager()
         self._transports: Dict[str, Any] = {}  # Stores FastMCP Transport instances
+        self._connections: Dict[str, asyncio.Task] = {}  # Client connection tasks
+        self._exit_stacks: Dict[str, AsyncExitStack] = {}  # Per-server cleanup
+        self._transport_plans: Dict[str, TransportPlan] = {}  # Cached transport plans
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)  # Lifecycle
+
+        # Converted list_tools results by server ID, with the time they were fetched
+        self._tools_cache: Dict[str, Tuple[float, List[ToolInfo]]] = {}
+        self._tools_cache_ttl = 300.0  # Seconds
+        self._tools_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._pending_tools: Dict[str, asyncio.Task[List[ToolInfo]]] = {}  # On start
 
     # ========== Server Configuration Operations ==========
 
@@ -53,8 +68,6 @@ class MCPServerManager:
         Returns:
             ServerInfo: Created server information
         """
-        from ..api.models.server import ServerConfig
-
         config = ServerConfig(
             name=name,
             transport="stdio",
@@ -109,10 +122,57 @@ class MCPServerManager:
         if not server:
             raise MCPError(f"Server with ID '{server_id}' not found")
 
-        return await lifecycle_manager.start_server(
-            server,
-            self._transports,
-            self._process_manager,
+        # Serialize lifecycle changes so concurrent starts cannot spawn twice
+        async with self._locks[server.id]:
+            # Only a start that creates the connection replaces the cached
+            # tools; starting an already running server leaves them alone
+            starting = server.id not in self._connections
+            if starting:
+                self._invalidate_tools_cache(server.id)
+            server = await lifecycle_manager.start_server(
+                server,
+                self._transports,
+                self._connections,
+                self._exit_stacks,
+                self._transport_plans,
+                self._process_manager,
+            )
+            if starting:
+                self._prefetch_tools(server)
+            return server
+
+    async def start_all(
+        self, server_ids: List[str], max_concurrency: int = 8
+    ) -> List[Union[ServerInfo, BaseException]]:
+        """
+        Start several MCP servers concurrently.
+
+        Each server's client connection is awaited inside the concurrency
+        limit, so at most max_concurrency subprocesses are spawning at once.
+
+        Args:
+            server_ids: Server identifiers (UUIDs or slugs)
+            max_concurrency: Maximum number of servers starting at once
+
+        Returns:
+            Updated server information for each ID, in order, or the
+            exception raised while starting that server
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _start(server_id: str) -> ServerInfo:
+            async with semaphore:
+                server = await self.start_server(server_id)
+                if await self._get_client(server) is None:
+                    server = self._process_manager.get_server(server.id) or server
+                    raise MCPError(
+                        f"Failed to connect to server '{server.config.name}': "
+                        f"{server.error_message}"
+                    )
+                return server
+
+        return await asyncio.gather(
+            *[_start(server_id) for server_id in server_ids], return_exceptions=True
         )
 
     async def stop_server(self, server_id: str) -> ServerInfo:
@@ -132,10 +192,38 @@ class MCPServerManager:
         if not server:
             raise MCPError(f"Server with ID '{server_id}' not found")
 
-        return await lifecycle_manager.stop_server(
-            server,
-            self._transports,
-            self._process_manager,
+        async with self._locks[server.id]:
+            self._invalidate_tools_cache(server.id)
+            return await lifecycle_manager.stop_server(
+                server,
+                self._transports,
+                self._connections,
+                self._exit_stacks,
+                self._process_manager,
+            )
+
+    async def stop_all(
+        self, server_ids: List[str], max_concurrency: int = 8
+    ) -> List[Union[ServerInfo, BaseException]]:
+        """
+        Stop several MCP servers concurrently.
+
+        Args:
+            server_ids: Server identifiers (UUIDs or slugs)
+            max_concurrency: Maximum number of servers stopping at once
+
+        Returns:
+            Updated server information for each ID, in order, or the
+            exception raised while stopping that server
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _stop(server_id: str) -> ServerInfo:
+            async with semaphore:
+                return await self.stop_server(server_id)
+
+        return await asyncio.gather(
+            *[_stop(server_id) for server_id in server_ids], return_exceptions=True
         )
 
     async def remove_server(self, server_id: str) -> bool:
@@ -155,18 +243,38 @@ class MCPServerManager:
         if not server:
             return False
 
-        return await lifecycle_manager.remove_server(
-            server,
-            self._transports,
-            self._process_manager,
-        )
+        async with self._locks[server.id]:
+            self._invalidate_tools_cache(server.id)
+            self._tools_locks.pop(server.id, None)
+            removed = await lifecycle_manager.remove_server(
+                server,
+                self._transports,
+                self._connections,
+                self._exit_stacks,
+                self._transport_plans,
+                self._process_manager,
+            )
+        self._locks.pop(server.id, None)
+        return removed
+
+    async def shutdown_all(self, max_concurrency: int = 32) -> None:
+        """
+        Shutdown all running servers and clean up transports.
 
-    async def shutdown_all(self) -> None:
-        """Shutdown all running servers and clean up transports."""
+        Args:
+            max_concurrency: Maximum number of servers being closed at once
+        """
+        for server_id in list(self._pending_tools):
+            self._invalidate_tools_cache(server_id)
+        self._tools_cache.clear()
         await lifecycle_manager.shutdown_all(
             self._transports,
+            self._connections,
+            self._exit_stacks,
             self._process_manager,
+            max_concurrency,
         )
+        self._process_manager._flush_servers()
 
     # ========== Tool Operations ==========
 
@@ -181,21 +289,42 @@ class MCPServerManager:
             List of available tools
 
         Raises:
-            MCPError: If server not running or transport not available
+            MCPError: If server not running or client not available
         """
         server = self._process_manager.get_server(server_id)
         if not server:
             raise MCPError(f"Server with ID or slug '{server_id}' not found")
 
-        transport = self._transports.get(server.id)
-        return await tool_operations.get_server_tools(server, transport)
+        # Serve from cache while fresh; one caller per server refreshes it
+        async with self._tools_locks[server.id]:
+            cached = self._get_cached_tools(server)
+            if cached is not None:
+                return cached
+
+            tools = await self._take_prefetched_tools(server.id)
+            if tools is None:
+                client = await self._get_client(server)
+                try:
+                    tools = await tool_operations.get_server_tools(server, client)
+                except ConnectionError:
+                    server, client = await self._reconnect(server, client)
+                    tools = await tool_operations.get_server_tools(server, client)
+            self._tools_cache[server.id] = (time.monotonic(), tools)
+            return tools
 
     async def call_server_tool(
-        self, server_id: str, tool_name: str, arguments: Dict[str, Any] = None
+        self,
+        server_id: str,
+        tool_name: str,
+        arguments: Optional[Dict[str, Any]] = None,
     ) -> Any:
         """
         Call a tool on a running server.
 
+        If the server's connection was lost (e.g. its subprocess died), the
+        client is reconnected, respawning the server, and the call is retried
+        once.
+
         Args:
             server_id: Server identifier (UUID or slug)
             tool_name: Name of the tool to call
@@ -205,22 +334,149 @@ class MCPServerManager:
             Tool execution result
 
         Raises:
-            MCPError: If server not running or transport not available
+            MCPError: If server not running or client not available
         """
         server = self._process_manager.get_server(server_id)
         if not server:
             raise MCPError(f"Server with ID or slug '{server_id}' not found")
 
-        transport = self._transports.get(server.id)
-        return await tool_operations.call_server_tool(
-            server,
-            transport,
-            tool_name,
-            arguments,
-        )
+        client = await self._get_client(server)
+        try:
+            return await tool_operations.call_server_tool(
+                server,
+                client,
+                tool_name,
+                arguments,
+            )
+        except ConnectionError:
+            server, client = await self._reconnect(server, client)
+            return await tool_operations.call_server_tool(
+                server,
+                client,
+                tool_name,
+                arguments,
+            )
+
+    async def call_server_tools_batch(
+        self,
+        server_id: str,
+        calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+    ) -> List[Union[Any, BaseException]]:
+        """
+        Call several tools on a running server concurrently.
+
+        Calls that fail because the server's connection was lost are retried
+        once after reconnecting, as in call_server_tool.
+
+        Args:
+            server_id: Server identifier (UUID or slug)
+            calls: (tool name, arguments) pairs whose inputs do not depend on
+                each other's results
+
+        Returns:
+            Tool execution result for each call, in order, or the exception
+            raised by that call
+
+        Raises:
+            MCPError: If server not running or client not available
+        """
+        server = self._process_manager.get_server(server_id)
+        if not server:
+            raise MCPError(f"Server with ID or slug '{server_id}' not found")
+
+        client = await self._get_client(server)
+        results = await tool_operations.call_server_tools_batch(server, client, calls)
+
+        # Retry the calls that failed because the connection was lost
+        lost = [
+            i for i, result in enumerate(results) if isinstance(result, ConnectionError)
+        ]
+        if lost:
+            server, client = await self._reconnect(server, client)
+            retried = await tool_operations.call_server_tools_batch(
+                server, client, [calls[i] for i in lost]
+            )
+            for i, result in zip(lost, retried):
+                results[i] = result
+        return results
 
     # ========== Utility Methods ==========
 
+    def _get_cached_tools(self, server: ServerInfo) -> Optional[List[ToolInfo]]:
+        """Return cached tools for a running server if they have not expired."""
+        entry = self._tools_cache.get(server.id)
+        if entry is None or server.status != ServerStatus.RUNNING:
+            return None
+
+        fetched_at, tools = entry
+        if time.monotonic() - fetched_at >= self._tools_cache_ttl:
+            del self._tools_cache[server.id]
+            return None
+        return tools
+
+    def _prefetch_tools(self, server: ServerInfo) -> None:
+        """
+        List a newly started server's tools in the background.
+
+        The request is issued as soon as the client connects, so the first
+        get_server_tools call usually finds the result already waiting.
+        """
+        if server.id not in self._connections:
+            return
+
+        async def _fetch() -> List[ToolInfo]:
+            client = await self._get_client(server)
+            return await tool_operations.get_server_tools(server, client)
+
+        task = asyncio.create_task(_fetch())
+        # Failures are retried by get_server_tools; mark them as retrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._pending_tools[server.id] = task
+
+    async def _take_prefetched_tools(self, server_id: str) -> Optional[List[ToolInfo]]:
+        """Return the prefetched tools for a server, or None if unavailable."""
+        task = self._pending_tools.pop(server_id, None)
+        if task is None:
+            return None
+        try:
+            return await task
+        except Exception:
+            return None
+
+    def _invalidate_tools_cache(self, server_id: str) -> None:
+        """Drop cached and prefetched tools for a server."""
+        self._tools_cache.pop(server_id, None)
+        task = self._pending_tools.pop(server_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _get_client(self, server: ServerInfo) -> Optional[Any]:
+        """Get the persistent FastMCP client for a server."""
+        return await lifecycle_manager.get_client(server, self._connections)
+
+    async def _reconnect(
+        self, server: ServerInfo, client: Optional[Any]
+    ) -> Tuple[ServerInfo, Optional[Any]]:
+        """
+        Replace a client whose connection was lost.
+
+        The server's cached tools are dropped, since they were listed from
+        the process that died.
+
+        Returns:
+            Current server information and the new client
+        """
+        self._invalidate_tools_cache(server.id)
+        client = await lifecycle_manager.reconnect(
+            server,
+            client,
+            self._transports,
+            self._connections,
+            self._exit_stacks,
+            self._process_manager,
+        )
+        return self._process_manager.get_server(server.id) or server, client
+
     def get_transport(self, server_id: str) -> Optional[Any]:
         """
         Get the FastMCP transport for a server.
@@ -243,8 +499,6 @@ class MCPServerManager:
         Returns:
             True if server has a transport (is running), False otherwise
         """
-        from ..api.models.server import ServerStatus
-
         server = self._process_manager.get_server(server_id)
         if not server:
             return False
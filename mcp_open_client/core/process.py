@@ -5,13 +5,28 @@ Note: Actual process lifecycle is now managed by FastMCP clients in manager.py.
 This module handles server configuration persistence and state tracking only.
 """
 
+import asyncio
+import functools
 import json
 import logging
+import os
 import re
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped, import-not-found]
+except ImportError:
+    ijson = None  # type: ignore[assignment]
 
 from ..api.models.server import ServerConfig, ServerInfo, ServerStatus
 from ..config import ensure_config_directory, get_config_path
@@ -20,28 +35,92 @@ from ..exceptions import MCPError
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Config files larger than this are stream-parsed with ijson when available
+_STREAM_LOAD_THRESHOLD = 256 * 1024  # Bytes
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+class _ServerRecord(BaseModel):
+    """A server entry as persisted by ProcessManager._save_servers."""
+
+    id: str
+    slug: Optional[str] = None
+    config: Optional[ServerConfig] = None
+    created_at: Optional[str] = None
+
+
+# Validates every persisted server entry in a single pydantic-core pass
+_SERVER_RECORDS = TypeAdapter(List[_ServerRecord])
+
+
+def _has_config(server_data: Any) -> bool:
+    """
+    Check whether a persisted server entry has a configuration to load.
+
+    Entries with an empty or missing config are skipped without validating
+    their other fields, so one of them cannot fail the whole load.
+    """
+    return isinstance(server_data, dict) and bool(server_data.get("config"))
+
 
+class _SlugTable(dict):
+    """
+    str.translate table for slugs.
+
+    Keeps a-z, 0-9 and hyphens, maps whitespace and underscores to hyphens
+    and drops everything else. Entries for other code points are filled in
+    on first use.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        value = "-" if char.isspace() or char == "_" else None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable(
+    (ord(char), char) for char in "abcdefghijklmnopqrstuvwxyz0123456789-"
+)
+_DASHES = re.compile(r"-{2,}")
+
+
+@functools.lru_cache(maxsize=1024)
 def _slugify(text: str) -> str:
     """
     Convert text to a URL-friendly slug.
 
+    Results are memoized per process, since the same names are slugified
+    again on every reload.
+
     Args:
         text: Text to slugify
 
     Returns:
         Slugified text
     """
-    # Convert to lowercase
-    text = text.lower()
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
-    # Remove any characters that aren't alphanumeric or hyphens
-    text = re.sub(r"[^a-z0-9-]", "", text)
-    # Remove consecutive hyphens
-    text = re.sub(r"-+", "-", text)
-    # Strip leading/trailing hyphens
-    text = text.strip("-")
-    return text
+    # Lowercase, turn separators into hyphens and drop other characters
+    text = text.lower().translate(_SLUG_TABLE)
+    # Collapse consecutive hyphens and strip leading/trailing ones
+    return _DASHES.sub("-", text).strip("-")
 
 
 class ProcessManager:
@@ -52,6 +131,20 @@ class ProcessManager:
     This class only manages configuration persistence and status tracking.
     """
 
+    __slots__ = (
+        "_servers",
+        "_slug_to_id",
+        "_name_to_id",
+        "_slug_counter",
+        "_by_status",
+        "_config_file",
+        "_dirty",
+        "_save_task",
+        "_save_delay",
+        "_save_records",
+        "_saved_ids",
+    )
+
     def __init__(self, config_file: str = "mcp_servers.json"):
         """
         Initialize process manager.
@@ -61,10 +154,23 @@ class ProcessManager:
         """
         self._servers: Dict[str, ServerInfo] = {}
         self._slug_to_id: Dict[str, str] = {}  # Slug to UUID mapping
+        self._name_to_id: Dict[str, str] = {}  # Name to UUID mapping
+        self._slug_counter: Dict[str, int] = {}  # Next suffix to try per base slug
+        self._by_status: Dict[ServerStatus, Set[str]] = {
+            status: set() for status in ServerStatus
+        }  # Status to server IDs mapping
 
         # Ensure config directory exists and get config file path
         ensure_config_directory()
         self._config_file = get_config_path(config_file)
+
+        # Debounced saving: mutations mark the config dirty and one delayed
+        # task writes the file for all of them
+        self._dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self._save_delay = 0.25  # Seconds
+        self._save_records: Dict[str, Dict[str, Any]] = {}  # Saved entry per server
+        self._saved_ids: Optional[Tuple[str, ...]] = None  # Servers in the file
         self._load_servers()
 
     def _load_servers(self) -> None:
@@ -77,44 +183,72 @@ class ProcessManager:
             return
 
         try:
-            with open(self._config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            servers_data = data.get("servers", [])
-            for server_data in servers_data:
-                config_data = server_data.get("config")
-                if config_data:
-                    config = ServerConfig(**config_data)
-
-                    # Get or generate slug
-                    slug = (
-                        server_data.get("slug") or config.slug or _slugify(config.name)
-                    )
-
-                    # Reset status to configured (don't restore running state)
-                    server_info = ServerInfo(
-                        id=server_data["id"],
-                        slug=slug,
-                        config=config,
-                        status=ServerStatus.CONFIGURED,
-                        created_at=server_data.get(
-                            "created_at", datetime.utcnow().isoformat()
-                        ),
-                        started_at=None,  # Don't restore running state
-                        stopped_at=None,
-                        error_message=None,
-                        process_id=None,
-                    )
-
-                    self._servers[server_info.id] = server_info
-                    self._slug_to_id[slug] = server_info.id
+            now = _now_iso()
+
+            if (
+                ijson is not None
+                and self._config_file.stat().st_size > _STREAM_LOAD_THRESHOLD
+            ):
+                # Stream large files entry by entry instead of parsing the
+                # whole document into memory first
+                with open(self._config_file, "rb") as f:
+                    for server_data in ijson.items(f, "servers.item", use_float=True):
+                        if _has_config(server_data):
+                            self._ingest_server(
+                                _ServerRecord.model_validate(server_data), now
+                            )
+            else:
+                data = _loads(self._config_file.read_bytes())
+                records = _SERVER_RECORDS.validate_python(
+                    [s for s in data.get("servers", []) if _has_config(s)]
+                )
+                for record in records:
+                    self._ingest_server(record, now)
 
         except Exception as e:
             # If loading fails, start with empty server list
             logger.warning(
-                f"Failed to load server configurations from {self._config_file}: {e}"
+                "Failed to load server configurations from %s: %s", self._config_file, e
             )
             self._servers = {}
+            self._slug_to_id = {}
+            self._name_to_id = {}
+            self._save_records = {}
+            for server_ids in self._by_status.values():
+                server_ids.clear()
+
+    def _ingest_server(self, record: _ServerRecord, now: str) -> None:
+        """
+        Register one server entry read from the configuration file.
+
+        Args:
+            record: Validated server entry
+            now: Timestamp to use when the entry has no created_at
+        """
+        config = record.config
+        if not config:
+            return
+
+        # Get or generate slug
+        slug = record.slug or config.slug or _slugify(config.name)
+
+        # Reset status to configured (don't restore running state)
+        server_info = ServerInfo(
+            id=record.id,
+            slug=slug,
+            config=config,
+            status=ServerStatus.CONFIGURED,
+            created_at=record.created_at or now,
+            started_at=None,  # Don't restore running state
+            stopped_at=None,
+            error_message=None,
+            process_id=None,
+        )
+
+        self._servers[server_info.id] = server_info
+        self._slug_to_id[slug] = server_info.id
+        self._name_to_id.setdefault(config.name, server_info.id)
+        self._by_status[server_info.status].add(server_info.id)
 
     def _save_servers(self) -> None:
         """
@@ -122,49 +256,80 @@ class ProcessManager:
 
         Only saves configurations and metadata, not running processes.
         """
+        # Saved entries never change, so the file is current if it already
+        # holds exactly these servers
+        server_ids = tuple(self._servers)
+        if server_ids == self._saved_ids:
+            return
+
         try:
-            # Convert servers to dict format
-            servers_data = []
-            for server_id, server in self._servers.items():
-                server_dict = {
-                    "id": server.id,
-                    "slug": server.slug,
-                    "config": {
-                        "name": server.config.name,
-                        "slug": server.config.slug,
-                        "transport": server.config.transport,
-                        "command": server.config.command,
-                        "args": server.config.args,
-                        "env": server.config.env,
-                        "cwd": server.config.cwd,
-                    },
-                    "status": "configured",  # Always save as configured
-                    "created_at": server.created_at,
-                    "started_at": None,
-                    "stopped_at": None,
-                    "error_message": None,
-                    "process_id": None,
-                }
-                servers_data.append(server_dict)
+            # Convert servers to dict format, reusing entries built by
+            # earlier saves since persisted fields never change
+            servers_data = [
+                self._save_records.get(server_id) or self._build_save_record(server)
+                for server_id, server in self._servers.items()
+            ]
 
             # Save to file
             data = {
                 "servers": servers_data,
                 "version": "1.0",
-                "updated_at": datetime.utcnow().isoformat(),
+                "updated_at": _now_iso(),
             }
 
             # Create directory if it doesn't exist
             self._config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self._config_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temporary file and swap it in, so a crash never
+            # leaves a truncated config behind
+            tmp_file = self._config_file.with_suffix(self._config_file.suffix + ".tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._config_file)
+            self._saved_ids = server_ids
 
         except Exception as e:
             logger.warning(
-                f"Failed to save server configurations to {self._config_file}: {e}"
+                "Failed to save server configurations to %s: %s", self._config_file, e
             )
 
+    def _build_save_record(self, server: ServerInfo) -> Dict[str, Any]:
+        """Build and cache the persisted entry for a server."""
+        record = self._save_records[server.id] = {
+            "id": server.id,
+            "slug": server.slug,
+            "config": server.config.model_dump(mode="json"),
+            "status": "configured",  # Always save as configured
+            "created_at": server.created_at,
+            "started_at": None,
+            "stopped_at": None,
+            "error_message": None,
+            "process_id": None,
+        }
+        return record
+
+    def _schedule_save(self) -> None:
+        """Mark the configuration dirty and schedule a debounced save."""
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """Wait for further changes, then write the configuration once."""
+        try:
+            await asyncio.sleep(self._save_delay)
+        finally:
+            # Also write when cancelled, e.g. when the event loop shuts down
+            self._flush_servers()
+
+    def _flush_servers(self) -> None:
+        """Write pending configuration changes to disk immediately."""
+        if self._dirty:
+            self._dirty = False
+            self._save_servers()
+
     def _generate_unique_slug(self, base_slug: str) -> str:
         """
         Generate a unique slug by appending a number if necessary.
@@ -178,11 +343,13 @@ class ProcessManager:
         if base_slug not in self._slug_to_id:
             return base_slug
 
-        # Append numbers until we find a unique slug
-        counter = 1
+        # Append numbers until we find a unique slug, resuming after the
+        # last suffix handed out for this base
+        counter = self._slug_counter.get(base_slug, 1)
         while f"{base_slug}-{counter}" in self._slug_to_id:
             counter += 1
 
+        self._slug_counter[base_slug] = counter + 1
         return f"{base_slug}-{counter}"
 
     async def add_server(self, config: ServerConfig) -> ServerInfo:
@@ -199,9 +366,8 @@ class ProcessManager:
             MCPError: If server name already exists
         """
         # Check for duplicate names
-        for server in self._servers.values():
-            if server.config.name == config.name:
-                raise MCPError(f"Server with name '{config.name}' already exists")
+        if config.name in self._name_to_id:
+            raise MCPError(f"Server with name '{config.name}' already exists")
 
         # Generate unique ID
         server_id = str(uuid.uuid4())
@@ -223,14 +389,16 @@ class ProcessManager:
             slug=slug,
             config=config,
             status=ServerStatus.CONFIGURED,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=_now_iso(),
         )
 
         self._servers[server_id] = server_info
         self._slug_to_id[slug] = server_id
+        self._name_to_id[config.name] = server_id
+        self._by_status[server_info.status].add(server_id)
 
         # Save to JSON file
-        self._save_servers()
+        self._schedule_save()
 
         return server_info
 
@@ -244,17 +412,14 @@ class ProcessManager:
         Returns:
             ServerInfo or None if not found
         """
-        # Try as UUID first
+        # IDs take precedence, so a slug can never shadow a server's ID, even
+        # a hand-edited non-UUID one
         server = self._servers.get(server_id_or_slug)
         if server:
             return server
 
-        # Try as slug
         server_id = self._slug_to_id.get(server_id_or_slug)
-        if server_id:
-            return self._servers.get(server_id)
-
-        return None
+        return self._servers.get(server_id) if server_id else None
 
     def get_all_servers(self) -> List[ServerInfo]:
         """
@@ -265,6 +430,18 @@ class ProcessManager:
         """
         return list(self._servers.values())
 
+    def get_server_ids_by_status(self, status: ServerStatus) -> List[str]:
+        """
+        Get the IDs of all servers currently in a status.
+
+        Args:
+            status: Server status to look up
+
+        Returns:
+            List of server IDs
+        """
+        return list(self._by_status[status])
+
     def find_server_by_name(self, name: str) -> Optional[ServerInfo]:
         """
         Find server by name.
@@ -275,9 +452,9 @@ class ProcessManager:
         Returns:
             ServerInfo or None if not found
         """
-        for server in self._servers.values():
-            if server.config.name == name:
-                return server
+        server_id = self._name_to_id.get(name)
+        if server_id:
+            return self._servers.get(server_id)
         return None
 
     async def remove_server(self, server_id_or_slug: str) -> bool:
@@ -304,9 +481,13 @@ class ProcessManager:
 
         del self._servers[server.id]
         del self._slug_to_id[server.slug]
+        self._save_records.pop(server.id, None)
+        if self._name_to_id.get(server.config.name) == server.id:
+            del self._name_to_id[server.config.name]
+        self._by_status[server.status].discard(server.id)
 
         # Save to JSON file
-        self._save_servers()
+        self._schedule_save()
 
         return True
 
@@ -339,14 +520,53 @@ class ProcessManager:
         if not server:
             raise MCPError(f"Server with ID '{server_id}' not found")
 
-        # Update status
+        self._set_status(server, status, _now_iso(), process_id, error_message)
+        return server
+
+    def _bulk_update_server_status(
+        self, server_ids: Iterable[str], status: ServerStatus
+    ) -> List[ServerInfo]:
+        """
+        Update several servers to the same status in one pass.
+
+        The timestamp is computed once for the whole batch. Unknown server IDs
+        are skipped.
+
+        Args:
+            server_ids: Server identifiers
+            status: New server status
+
+        Returns:
+            List of updated servers
+        """
+        now = _now_iso()
+        updated = []
+        for server_id in server_ids:
+            server = self._servers.get(server_id)
+            if server:
+                self._set_status(server, status, now)
+                updated.append(server)
+        return updated
+
+    def _set_status(
+        self,
+        server: ServerInfo,
+        status: ServerStatus,
+        now: str,
+        process_id: Optional[int] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """Apply a status transition to a server and keep the status index in sync."""
+        # Update status and the status index
+        self._by_status[server.status].discard(server.id)
+        self._by_status[status].add(server.id)
         server.status = status
 
         # Update timestamps based on status
         if status == ServerStatus.STARTING:
             server.error_message = None
         elif status == ServerStatus.RUNNING:
-            server.started_at = datetime.utcnow().isoformat()
+            server.started_at = now
             server.stopped_at = None
             server.error_message = None
             if process_id:
@@ -354,10 +574,8 @@ class ProcessManager:
         elif status == ServerStatus.STOPPING:
             pass  # Keep current timestamps
         elif status == ServerStatus.STOPPED:
-            server.stopped_at = datetime.utcnow().isoformat()
+            server.stopped_at = now
             server.process_id = None
         elif status == ServerStatus.ERROR:
             server.error_message = error_message
             server.process_id = None
-
-        return server
@@ -55,8 +55,7 @@ class AIProviderManager:
             return
 
         try:
-            with open(self._config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(self._config_file.read_bytes())
 
             providers_data = data.get("providers", [])
             for provider_data in providers_data:
@@ -4,75 +4,104 @@ Tool Operations - Handle MCP tool discovery and execution.
 
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-try:
-    from fastmcp import Client
-except ImportError:
-    Client = None
+import anyio
 
 from ..api.models.server import ServerInfo, ServerStatus, ToolInfo
-from ..exceptions import MCPError
+from ..exceptions import ConnectionError, MCPError
 
 logger = logging.getLogger(__name__)
 
+# JSON-RPC error code the MCP SDK reports when the session's connection closed
+_CONNECTION_CLOSED = -32000
+
+# Errors raised when the stream to the server subprocess is gone
+_STREAM_ERRORS = (
+    OSError,
+    EOFError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+
+def _is_connection_lost(error: Optional[BaseException]) -> bool:
+    """
+    Check whether an error, or one it was raised from, means the connection
+    to the server is gone rather than the request itself failing.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if getattr(error, "code", None) == _CONNECTION_CLOSED or (
+            isinstance(error, _STREAM_ERRORS)
+            and not isinstance(error, asyncio.TimeoutError)
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _to_tool_info(tool: Any) -> ToolInfo:
+    """
+    Convert a FastMCP tool to a ToolInfo model.
+
+    FastMCP has already validated the tool, so the model is built with
+    model_construct to skip a second round of pydantic validation.
+    """
+    return ToolInfo.model_construct(
+        name=tool.name,
+        description=getattr(tool, "description", None),
+        input_schema=getattr(tool, "inputSchema", None),
+    )
+
 
 async def get_server_tools(
     server: ServerInfo,
-    transport: Any,
+    client: Any,
 ) -> List[ToolInfo]:
     """
     Get tools available from a running server.
 
-    Creates a temporary FastMCP Client using the stored transport.
-    The transport maintains the subprocess connection across calls.
+    Uses the server's persistent FastMCP client, so no MCP handshake is
+    repeated per call.
 
     Args:
         server: ServerInfo object
-        transport: FastMCP transport instance
+        client: Connected FastMCP client
 
     Returns:
         List of available tools
 
     Raises:
-        MCPError: If server not running or transport not available
+        ConnectionError: If the connection to the server was lost
+        MCPError: If server not running or client not available
     """
     if server.status != ServerStatus.RUNNING:
         raise MCPError(
             f"Server '{server.config.name}' is not running (status: {server.status})"
         )
 
-    if not transport:
-        raise MCPError(
-            f"No FastMCP transport available for server '{server.config.name}'"
-        )
+    if not client:
+        raise MCPError(f"No FastMCP client available for server '{server.config.name}'")
 
     try:
         logger.info(
             f"Getting tools from server '{server.config.name}' (ID: {server.id})"
         )
 
-        # Create temporary client with the transport
-        # The transport reuses the subprocess connection
-        async with Client(transport) as client:
-            # Add timeout to prevent hanging
-            tools_response = await asyncio.wait_for(
-                client.list_tools(), timeout=10.0  # 10 second timeout
-            )
+        # Add timeout to prevent hanging
+        tools_response = await asyncio.wait_for(
+            client.list_tools(), timeout=10.0  # 10 second timeout
+        )
 
-        # Convert FastMCP tools to ToolInfo models
-        tool_infos = []
         # Handle different response formats
         tools_list = (
             tools_response.tools if hasattr(tools_response, "tools") else tools_response
         )
-        for tool in tools_list:
-            tool_info = ToolInfo(
-                name=tool.name,
-                description=getattr(tool, "description", None),
-                input_schema=getattr(tool, "inputSchema", None),
-            )
-            tool_infos.append(tool_info)
+        # Convert FastMCP tools to ToolInfo models
+        tool_infos = [_to_tool_info(tool) for tool in tools_list]
 
         logger.info(
             f"Successfully got {len(tool_infos)} tools from server '{server.config.name}'"
@@ -85,6 +114,10 @@ async def get_server_tools(
             f"Timeout getting tools from server '{server.config.name}' (server may be unresponsive)"
         )
     except Exception as e:
+        if _is_connection_lost(e):
+            raise ConnectionError(
+                f"Lost connection to server '{server.config.name}': {e}"
+            ) from e
         logger.error(
             f"Error getting tools from server '{server.config.name}': {type(e).__name__}: {str(e)}"
         )
@@ -93,19 +126,19 @@ async def get_server_tools(
 
 async def call_server_tool(
     server: ServerInfo,
-    transport: Any,
+    client: Any,
     tool_name: str,
-    arguments: Dict[str, Any] = None,
+    arguments: Optional[Dict[str, Any]] = None,
 ) -> Any:
     """
     Call a tool on a running server.
 
-    Creates a temporary FastMCP Client using the stored transport.
-    The transport maintains the subprocess connection across calls.
+    Uses the server's persistent FastMCP client, so no MCP handshake is
+    repeated per call.
 
     Args:
         server: ServerInfo object
-        transport: FastMCP transport instance
+        client: Connected FastMCP client
         tool_name: Name of the tool to call
         arguments: Tool arguments
 
@@ -113,31 +146,27 @@ async def call_server_tool(
         Tool execution result
 
     Raises:
-        MCPError: If server not running or transport not available
+        ConnectionError: If the connection to the server was lost
+        MCPError: If server not running or client not available
     """
     if server.status != ServerStatus.RUNNING:
         raise MCPError(
             f"Server '{server.config.name}' is not running (status: {server.status})"
         )
 
-    if not transport:
-        raise MCPError(
-            f"No FastMCP transport available for server '{server.config.name}'"
-        )
+    if not client:
+        raise MCPError(f"No FastMCP client available for server '{server.config.name}'")
 
     try:
         logger.info(
             f"Calling tool '{tool_name}' on server '{server.config.name}' with args: {arguments}"
         )
 
-        # Create temporary client with the transport
-        # The transport reuses the subprocess connection
-        async with Client(transport) as client:
-            # Call tool with timeout
-            result = await asyncio.wait_for(
-                client.call_tool(tool_name, arguments or {}),
-                timeout=30.0,  # 30 second timeout for tool execution
-            )
+        # Call tool with timeout
+        result = await asyncio.wait_for(
+            client.call_tool(tool_name, arguments or {}),
+            timeout=30.0,  # 30 second timeout for tool execution
+        )
         logger.info(f"Tool '{tool_name}' completed successfully")
         return result
 
@@ -149,9 +178,55 @@ async def call_server_tool(
             f"Timeout calling tool '{tool_name}' on server '{server.config.name}' (tool execution took too long)"
         )
     except Exception as e:
+        if _is_connection_lost(e):
+            raise ConnectionError(
+                f"Lost connection to server '{server.config.name}' "
+                f"while calling tool '{tool_name}': {e}"
+            ) from e
         logger.error(
             f"Error calling tool '{tool_name}' on server '{server.config.name}': {type(e).__name__}: {str(e)}"
         )
         raise MCPError(
             f"Failed to call tool '{tool_name}' on server '{server.config.name}': {e}"
         )
+
+
+async def call_server_tools_batch(
+    server: ServerInfo,
+    client: Any,
+    calls: List[Tuple[str, Optional[Dict[str, Any]]]],
+) -> List[Union[Any, BaseException]]:
+    """
+    Call several tools on a running server concurrently.
+
+    All calls are sent over the server's single MCP session at once; the
+    session matches responses to requests, so independent calls overlap
+    instead of waiting for each other.
+
+    Args:
+        server: ServerInfo object
+        client: Connected FastMCP client
+        calls: (tool name, arguments) pairs
+
+    Returns:
+        Tool execution result for each call, in order, or the MCPError
+        raised by that call (a ConnectionError if the connection was lost)
+
+    Raises:
+        MCPError: If server not running or client not available
+    """
+    if server.status != ServerStatus.RUNNING:
+        raise MCPError(
+            f"Server '{server.config.name}' is not running (status: {server.status})"
+        )
+
+    if not client:
+        raise MCPError(f"No FastMCP client available for server '{server.config.name}'")
+
+    return await asyncio.gather(
+        *[
+            call_server_tool(server, client, tool_name, arguments)
+            for tool_name, arguments in calls
+        ],
+        return_exceptions=True,
+    )
@@ -3,14 +3,77 @@ FastMCP Client Factory - Creates appropriate FastMCP clients based on command co
 """
 
 import logging
-from typing import Any
-
+import os
+import re
+import shlex
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from fastmcp.client import NodeStdioTransport, PythonStdioTransport, StdioTransport
+except ImportError:
+    NodeStdioTransport = None  # type: ignore[misc, assignment]
+    PythonStdioTransport = None  # type: ignore[misc, assignment]
+    StdioTransport = None  # type: ignore[misc, assignment]
+
+from ..api.models.server import ServerConfig
 from ..exceptions import MCPError
 
 logger = logging.getLogger(__name__)
 
+# A transport plan is the transport class plus its constructor kwargs
+TransportPlan = Tuple[Any, Dict[str, Any]]
+
+# Classifies a command as npx, node or python in a single match. The group
+# that matched names the planner in _PLANNERS; other commands match nothing.
+_COMMAND_RE = re.compile(
+    r"(?P<npx>^(?:npx|npm\.cmd)$|npx\.cmd)"
+    r"|(?P<node>^node$|node\.exe$)"
+    r"|(?P<python>^python3?$|python\.exe$)",
+    re.IGNORECASE,
+)
+
+
+def plan_transport(config: ServerConfig) -> TransportPlan:
+    """
+    Select the FastMCP transport class and arguments for a configuration.
+
+    The plan only depends on the configuration, so callers can cache it and
+    build fresh transports from it with create_transport.
+
+    Args:
+        config: ServerConfig object with command, args, env, cwd
+
+    Returns:
+        Tuple of (transport class, constructor kwargs)
+
+    Raises:
+        MCPError: If FastMCP is not installed or the configuration is missing
+            required arguments
+    """
+    if StdioTransport is None:
+        raise MCPError("FastMCP is not installed. Install with: pip install fastmcp")
+
+    logger.info("Creating FastMCP client for command: %s", config.command)
+    logger.debug("Args: %s", config.args)
 
-def create_transport(config) -> Any:
+    # Dispatch npm/npx packages, node scripts and python modules
+    match = _COMMAND_RE.search(config.command)
+    if match and match.lastgroup:
+        return _PLANNERS[match.lastgroup](config)
+
+    # Fallback to generic stdio transport
+    logger.debug("Using fallback generic StdioTransport")
+    command, args = _split_command(config.command, config.args, config.cwd)
+    return StdioTransport, {
+        "command": command,
+        "args": args,
+        "env": config.env,
+        "cwd": config.cwd,
+        "keep_alive": True,
+    }
+
+
+def create_transport(config: ServerConfig, plan: Optional[TransportPlan] = None) -> Any:
     """
     Create appropriate FastMCP transport based on command configuration.
 
@@ -18,6 +81,7 @@ def create_transport(config) -> Any:
 
     Args:
         config: ServerConfig object with command, args, env, cwd
+        plan: Previously computed plan_transport result for this config
 
     Returns:
         FastMCP Transport instance
@@ -25,94 +89,83 @@ def create_transport(config) -> Any:
     Raises:
         MCPError: If transport creation fails
     """
-    from fastmcp.client import (
-        NodeStdioTransport,
-        NpxStdioTransport,
-        PythonStdioTransport,
-        StdioTransport,
-    )
-
-    command = config.command.lower()
-    logger.info(f"Creating FastMCP client for command: {config.command}")
-    logger.info(f"Command lower: {command}")
-    logger.info(f"Args: {config.args}")
-
-    # Handle npm/npx packages
-    if command == "npx" or command == "npm.cmd" or "npx.cmd" in command:
-        return _create_npx_transport(config)
-
-    # Handle node commands
-    elif command == "node" or command.endswith("node.exe"):
-        return _create_node_transport(config)
-
-    # Handle python commands
-    elif command == "python" or command == "python3" or command.endswith("python.exe"):
-        return _create_python_transport(config)
+    transport_cls, kwargs = plan or plan_transport(config)
+    return transport_cls(**kwargs)
 
-    # Fallback to generic stdio transport
-    logger.info("Using fallback generic StdioTransport")
-    return StdioTransport(
-        command=config.command,
-        args=config.args,
-        env=config.env,
-        cwd=config.cwd,
-        keep_alive=True,
-    )
 
+def _split_command(
+    command: str, args: List[str], cwd: Optional[str] = None
+) -> Tuple[str, List[str]]:
+    """
+    Split a command such as "uv run" into an executable and argv.
 
-def _create_npx_transport(config) -> Any:
-    """Create StdioTransport for npm/npx packages."""
-    from fastmcp.client import StdioTransport
+    The subprocess is spawned without a shell, so a command containing
+    spaces is tokenized here unless it names an existing file. Relative
+    paths are resolved against cwd, where the subprocess will run.
+    """
+    args = list(args or [])
+    if " " not in command.strip() or os.path.exists(os.path.join(cwd or "", command)):
+        return command, args
 
-    logger.info("Detected npx/npm command, using StdioTransport directly")
+    parts = shlex.split(command, posix=os.name != "nt")
+    return parts[0], parts[1:] + args
+
+
+def _plan_npx_transport(config: ServerConfig) -> TransportPlan:
+    """Plan a StdioTransport for npm/npx packages."""
+    logger.debug("Detected npx/npm command, using StdioTransport directly")
 
     # Use StdioTransport directly with full command
     # This is the recommended approach per FastMCP documentation
-    logger.info(f"Command: {config.command}, Args: {config.args}")
-    return StdioTransport(
-        command=config.command,
-        args=config.args,
-        env=config.env,
-        cwd=config.cwd,
-        keep_alive=True,
-    )
-
+    logger.debug("Command: %s, Args: %s", config.command, config.args)
+    return StdioTransport, {
+        "command": config.command,
+        "args": config.args,
+        "env": config.env,
+        "cwd": config.cwd,
+        "keep_alive": True,
+    }
 
-def _create_node_transport(config) -> Any:
-    """Create NodeStdioTransport for Node.js scripts."""
-    from fastmcp.client import NodeStdioTransport
 
-    logger.info("Detected node command, using NodeStdioTransport")
+def _plan_node_transport(config: ServerConfig) -> TransportPlan:
+    """Plan a NodeStdioTransport for Node.js scripts."""
+    logger.debug("Detected node command, using NodeStdioTransport")
 
     if config.args:
         script_path = config.args[0]
         remaining_args = config.args[1:] if len(config.args) > 1 else []
-        return NodeStdioTransport(
-            script_path=script_path,
-            args=remaining_args,
-            env=config.env,
-            cwd=config.cwd,
-            keep_alive=True,
-        )
+        return NodeStdioTransport, {
+            "script_path": script_path,
+            "args": remaining_args,
+            "env": config.env,
+            "cwd": config.cwd,
+            "keep_alive": True,
+        }
     else:
         raise MCPError("No script path provided for node command")
 
 
-def _create_python_transport(config) -> Any:
-    """Create PythonStdioTransport for Python modules."""
-    from fastmcp.client import PythonStdioTransport
-
-    logger.info("Detected python command, using PythonStdioTransport")
+def _plan_python_transport(config: ServerConfig) -> TransportPlan:
+    """Plan a PythonStdioTransport for Python modules."""
+    logger.debug("Detected python command, using PythonStdioTransport")
 
     if config.args:
         module_path = config.args[0]
         remaining_args = config.args[1:] if len(config.args) > 1 else []
-        return PythonStdioTransport(
-            script_path=module_path,
-            args=remaining_args,
-            env=config.env,
-            cwd=config.cwd,
-            keep_alive=True,
-        )
+        return PythonStdioTransport, {
+            "script_path": module_path,
+            "args": remaining_args,
+            "env": config.env,
+            "cwd": config.cwd,
+            "keep_alive": True,
+        }
     else:
         raise MCPError("No module path provided for python command")
+
+
+# Planner for each _COMMAND_RE group
+_PLANNERS: Dict[str, Callable[[ServerConfig], TransportPlan]] = {
+    "npx": _plan_npx_transport,
+    "node": _plan_node_transport,
+    "python": _plan_python_transport,
+}
@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from mcp_open_client.config import setup
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path, monkeypatch):
+    """Keep configuration files in a temporary directory instead of ~."""
+    path = tmp_path / ".mcp-open-client"
+    monkeypatch.setattr(setup, "DEFAULT_CONFIG_DIR", path)
+    return path
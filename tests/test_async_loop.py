@@ -0,0 +1,100 @@
+"""
+Tests for the synchronous MCP client wrapper.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from mcp_open_client.core.async_loop import MCPClientWrapper
+
+
+class StubManager:
+    """Records manager calls and the thread each one ran on."""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    async def _record(self, *call):
+        self.calls.append(call)
+        self.threads.add(threading.current_thread().name)
+        return call
+
+    async def start_server(self, server_id):
+        return await self._record("start_server", server_id)
+
+    async def stop_server(self, server_id):
+        return await self._record("stop_server", server_id)
+
+    async def get_server_tools(self, server_id):
+        return await self._record("get_server_tools", server_id)
+
+    async def call_server_tool(self, server_id, tool_name, arguments=None):
+        return await self._record("call_server_tool", server_id, tool_name, arguments)
+
+    async def shutdown_all(self):
+        return await self._record("shutdown_all")
+
+
+class HangingManager(StubManager):
+    """Manager whose server start never finishes."""
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = threading.Event()
+
+    async def start_server(self, server_id):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+
+
+def test_sync_calls_run_on_loop_thread():
+    """Test that sync calls are dispatched to the manager on the loop thread."""
+    manager = StubManager()
+    wrapper = MCPClientWrapper(manager)
+
+    try:
+        assert wrapper.start_server_sync("srv") == ("start_server", "srv")
+        assert wrapper.list_tools_sync("srv") == ("get_server_tools", "srv")
+        assert wrapper.call_tool_sync("srv", "echo", {"text": "hi"}) == (
+            "call_server_tool",
+            "srv",
+            "echo",
+            {"text": "hi"},
+        )
+        assert wrapper.stop_server_sync("srv") == ("stop_server", "srv")
+    finally:
+        wrapper.close()
+
+    assert manager.threads == {"mcp-async-loop"}
+
+
+def test_close_shuts_down_servers_and_stops_thread():
+    """Test that close shuts down all servers and stops the loop thread."""
+    manager = StubManager()
+    wrapper = MCPClientWrapper(manager)
+
+    wrapper.close()
+
+    assert manager.calls == [("shutdown_all",)]
+    assert not wrapper._loop_thread.is_alive()
+    assert wrapper._loop_thread.loop.is_closed()
+
+
+def test_timed_out_call_is_cancelled():
+    """Test that a call the caller stopped waiting for is cancelled on the loop."""
+    manager = HangingManager()
+    wrapper = MCPClientWrapper(manager, timeout=0.1)
+
+    try:
+        with pytest.raises(concurrent.futures.TimeoutError):
+            wrapper.start_server_sync("srv")
+        assert manager.cancelled.wait(5)
+    finally:
+        wrapper.close()
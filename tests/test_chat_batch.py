@@ -0,0 +1,98 @@
+"""
+Tests for the composite conversation chat endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from mcp_open_client.api.models.server import ServerStatus, ToolInfo
+
+
+class StubServer:
+    """Running server as seen by the tool endpoints."""
+
+    status = ServerStatus.RUNNING
+
+
+class StubServerManager:
+    """Server manager with one running server exposing an echo tool."""
+
+    def get_server(self, server_id):
+        return StubServer() if server_id == "echo-server" else None
+
+    async def get_server_tools(self, server_id):
+        return [ToolInfo(name="echo")]
+
+
+@pytest.fixture
+def conversations(config_dir, monkeypatch):
+    """Conversation manager backed by the temporary config dir."""
+    # Imported here so the app's shared managers use the temporary config dir
+    from mcp_open_client.api.endpoints.conversations import (
+        chat_endpoints,
+        tools_endpoints,
+    )
+    from mcp_open_client.config import ensure_config_directory
+    from mcp_open_client.core.conversations.conversation_manager import (
+        ConversationManager,
+    )
+    from mcp_open_client.core.provider_manager import AIProviderManager
+
+    ensure_config_directory()
+    manager = ConversationManager()
+    for module in (chat_endpoints, tools_endpoints):
+        monkeypatch.setattr(module, "conversation_manager", manager)
+        monkeypatch.setattr(module, "server_manager", StubServerManager())
+    monkeypatch.setattr(chat_endpoints, "provider_manager", AIProviderManager())
+    return manager
+
+
+@pytest.fixture
+def client(conversations):
+    """Test client for the API app."""
+    from mcp_open_client.api.main import app
+
+    return TestClient(app)
+
+
+def test_chat_batch_unknown_conversation(client):
+    """Test that an unknown conversation returns 404."""
+    response = client.post("/conversations/missing/chat/batch", json={"content": "hi"})
+
+    assert response.status_code == 404
+
+
+def test_chat_batch_enables_tools_before_chat(client, conversations):
+    """Test that tools are enabled even when the chat step fails."""
+    conversation = conversations.create_conversation(title="Batch")
+
+    response = client.post(
+        f"/conversations/{conversation.id}/chat/batch",
+        json={
+            "enable_tools": [{"server_id": "echo-server", "tool_name": "echo"}],
+            "content": "hi",
+        },
+    )
+
+    # No default provider is configured in the temporary config dir
+    assert response.status_code == 400
+    assert [
+        (tool.server_id, tool.tool_name)
+        for tool in conversations.get_tools(conversation.id)
+    ] == [("echo-server", "echo")]
+
+
+def test_chat_batch_unknown_tool(client, conversations):
+    """Test that enabling a tool the server does not have fails the request."""
+    conversation = conversations.create_conversation(title="Batch")
+
+    response = client.post(
+        f"/conversations/{conversation.id}/chat/batch",
+        json={
+            "enable_tools": [{"server_id": "echo-server", "tool_name": "missing"}],
+            "content": "hi",
+        },
+    )
+
+    assert response.status_code >= 400
+    assert conversations.get_tools(conversation.id) == []
@@ -0,0 +1,114 @@
+"""
+Tests for the MCP Server Manager.
+"""
+
+import os
+import signal
+import sys
+
+import pytest
+import pytest_asyncio
+
+from mcp_open_client.api.models.server import ServerStatus
+from mcp_open_client.core.manager import MCPServerManager
+
+SERVER_SCRIPT = '''
+import os
+
+from fastmcp import FastMCP
+
+mcp = FastMCP("adder")
+
+
+@mcp.tool
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+@mcp.tool
+def pid() -> int:
+    """Return the server process ID."""
+    return os.getpid()
+
+
+if __name__ == "__main__":
+    mcp.run(show_banner=False)
+'''
+
+
+@pytest_asyncio.fixture
+async def manager(config_dir):
+    """Manager whose server configuration lives in the temporary config dir."""
+    manager = MCPServerManager()
+    yield manager
+    await manager.shutdown_all()
+
+
+@pytest.fixture
+def server_script(tmp_path):
+    """Path to a FastMCP stdio server script."""
+    script = tmp_path / "adder_server.py"
+    script.write_text(SERVER_SCRIPT)
+    return str(script)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_after_server_process_dies(manager, server_script):
+    """Test that a server whose process died is respawned on the next call."""
+    server = await manager.add_server("adder", sys.executable, [server_script])
+    await manager.start_server(server.id)
+
+    first_pid = (await manager.call_server_tool(server.id, "pid")).data
+    os.kill(first_pid, signal.SIGTERM)
+
+    result = await manager.call_server_tool(server.id, "add", {"a": 2, "b": 2})
+    assert result.data == 4
+    result = await manager.call_server_tool(server.id, "add", {"a": 3, "b": 3})
+    assert result.data == 6
+
+    assert (await manager.call_server_tool(server.id, "pid")).data != first_pid
+    assert manager.get_server(server.id).status == ServerStatus.RUNNING
+
+
+@pytest.mark.asyncio
+async def test_start_after_failed_connect(manager):
+    """Test that a server whose connection failed can be started again."""
+    server = await manager.add_server("missing", "/nonexistent/bin")
+
+    await manager.start_server(server.id)
+    assert await manager._get_client(server) is None
+    assert manager.get_server(server.id).status == ServerStatus.ERROR
+    assert server.id not in manager._transports
+
+    results = await manager.start_all([server.id])
+    assert isinstance(results[0], Exception)
+    assert manager.get_server(server.id).status == ServerStatus.ERROR
+
+
+@pytest.mark.asyncio
+async def test_reconnect_drops_cached_tools(manager, server_script):
+    """Test that tools cached from a dead server process are not served."""
+    server = await manager.add_server("adder", sys.executable, [server_script])
+    await manager.start_server(server.id)
+
+    await manager.get_server_tools(server.id)
+    assert server.id in manager._tools_cache
+
+    os.kill((await manager.call_server_tool(server.id, "pid")).data, signal.SIGTERM)
+    await manager.call_server_tool(server.id, "add", {"a": 1, "b": 1})
+    assert server.id not in manager._tools_cache
+
+
+@pytest.mark.asyncio
+async def test_start_running_server_keeps_cached_tools(manager, server_script):
+    """Test that starting an already running server does not refetch its tools."""
+    server = await manager.add_server("adder", sys.executable, [server_script])
+    await manager.start_server(server.id)
+
+    await manager.get_server_tools(server.id)
+    cached = manager._tools_cache[server.id]
+
+    await manager.start_server(server.id)
+    assert manager._tools_cache[server.id] is cached
+    assert server.id not in manager._pending_tools
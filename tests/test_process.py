@@ -0,0 +1,70 @@
+"""
+Tests for the server configuration ProcessManager.
+"""
+
+import json
+
+import pytest
+
+from mcp_open_client.api.models.server import ServerConfig
+from mcp_open_client.core.process import ProcessManager
+
+SERVER_CONFIG = {"name": "echo", "transport": "stdio", "command": "python"}
+
+
+def write_servers(config_dir, servers):
+    """Write a mcp_servers.json with the given entries."""
+    config_dir.mkdir(parents=True, exist_ok=True)
+    path = config_dir / "mcp_servers.json"
+    path.write_text(json.dumps({"servers": servers}))
+    return path
+
+
+def test_load_skips_entries_without_config(config_dir):
+    """Test that entries with an empty or missing config do not fail the load."""
+    write_servers(
+        config_dir,
+        [
+            {"id": "a", "config": {}},
+            {"slug": "no-id", "config": None},
+            {"id": "b", "slug": "echo", "config": SERVER_CONFIG},
+        ],
+    )
+
+    manager = ProcessManager()
+
+    assert [server.id for server in manager.get_all_servers()] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_save_keeps_servers_loaded_next_to_empty_entries(config_dir):
+    """Test that saving after such a load does not drop the valid servers."""
+    path = write_servers(
+        config_dir,
+        [{"id": "a", "config": {}}, {"id": "b", "config": SERVER_CONFIG}],
+    )
+
+    manager = ProcessManager()
+    await manager.add_server(ServerConfig(**{**SERVER_CONFIG, "name": "other"}))
+    manager._flush_servers()
+
+    saved = json.loads(path.read_text())["servers"]
+    assert len(saved) == 2
+    assert saved[0]["id"] == "b"
+
+
+def test_get_server_prefers_id_over_slug(config_dir):
+    """Test that a non-UUID ID is not shadowed by another server's slug."""
+    write_servers(
+        config_dir,
+        [
+            {"id": "echo", "slug": "first", "config": SERVER_CONFIG},
+            {"id": "b", "slug": "echo", "config": SERVER_CONFIG},
+        ],
+    )
+
+    manager = ProcessManager()
+
+    assert manager.get_server("echo").id == "echo"
+    assert manager.get_server("first").id == "echo"
+    assert manager.get_server("b").id == "b"
@@ -0,0 +1,52 @@
+"""
+Tests for the FastMCP transport factory.
+"""
+
+from mcp_open_client.api.models.server import ServerConfig
+from mcp_open_client.core.transport_factory import _split_command, plan_transport
+
+
+def make_script(tmp_path):
+    """Create an executable path containing a space: <tmp>/My Server/run.sh."""
+    script = tmp_path / "My Server" / "run.sh"
+    script.parent.mkdir()
+    script.write_text("#!/bin/sh\n")
+    return script
+
+
+def test_split_command_with_arguments():
+    """Test that a multi-word command is split into executable and argv."""
+    assert _split_command("uv run", ["server.py"]) == ("uv", ["run", "server.py"])
+
+
+def test_split_command_keeps_existing_path_with_spaces(tmp_path):
+    """Test that an existing file whose path contains spaces is not split."""
+    script = str(make_script(tmp_path))
+
+    assert _split_command(script, ["--flag"]) == (script, ["--flag"])
+
+
+def test_split_command_resolves_relative_path_against_cwd(tmp_path):
+    """Test that a path relative to the server's cwd is not split."""
+    make_script(tmp_path)
+    command = "./My Server/run.sh"
+
+    assert _split_command(command, [], str(tmp_path)) == (command, [])
+    assert _split_command(command, []) == ("./My", ["Server/run.sh"])
+
+
+def test_plan_transport_passes_cwd_to_split(tmp_path):
+    """Test that the generic stdio plan resolves the command in config.cwd."""
+    make_script(tmp_path)
+    config = ServerConfig(
+        name="script",
+        transport="stdio",
+        command="./My Server/run.sh",
+        args=["--flag"],
+        cwd=str(tmp_path),
+    )
+
+    _, kwargs = plan_transport(config)
+
+    assert kwargs["command"] == "./My Server/run.sh"
+    assert kwargs["args"] == ["--flag"]